@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Search benchmark for YouTube Liked Videos Searcher
+Times regex and fuzzy searches over a synthetic library, in-process and
+sharded across an increasing number of worker processes.
+
+Usage: python benchmarks/bench_search.py [--videos 100000] [--repeat 3]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from youtube_searcher import DescriptionStore, ShardedSearch, match_records  # noqa: E402
+
+WORDS = """
+compiler garbage collection runtime memory allocator python rust kernel scheduler
+network latency database index query planner cooking recipe pasta guitar chord
+review unboxing camera lens travel vlog mountain history lecture physics quantum
+music live concert tutorial beginner advanced interview podcast design pattern
+""".split()
+
+QUERIES = [
+    ('Regex', r'garbage\s+collect\w*'),
+    ('Fuzzy', 'compilr scheduller'),
+]
+
+
+def make_videos(count, seed=0):
+    """Generate synthetic videos with long descriptions"""
+    rng = random.Random(seed)
+    videos = []
+    for i in range(count):
+        videos.append({
+            'id': f"v{i:010d}",
+            'title': ' '.join(rng.choices(WORDS, k=6)),
+            'channel': rng.choice(WORDS).title() + ' Channel',
+            'published_at': '2024-01-01T00:00:00Z',
+            'description': ' '.join(rng.choices(WORDS, k=rng.randint(50, 400))),
+            'url': f"https://www.youtube.com/watch?v=v{i:010d}",
+        })
+    return videos
+
+
+def best_time(func, repeat):
+    """Best wall-clock time of several runs, in seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def worker_counts():
+    counts = []
+    n = 1
+    while n < (os.cpu_count() or 1):
+        counts.append(n)
+        n *= 2
+    counts.append(os.cpu_count() or 1)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--videos', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='yls_bench_')
+    try:
+        print(f"Building store for {args.videos} synthetic videos...")
+        store = DescriptionStore(os.path.join(workdir, 'descriptions.bin'))
+        store.rebuild(make_videos(args.videos), lambda video: video['description'], '0' * 40)
+        print(f"Store size: {os.path.getsize(store.path) / 1e6:.1f} MB, CPUs: {os.cpu_count()}")
+        print()
+
+        for mode, query in QUERIES:
+            print(f"{mode} query {query!r}")
+
+            def in_process():
+                records = ((row, store.folded_text(row)) for row in range(len(store.ids)))
+                return match_records(records, mode, query)
+
+            baseline = best_time(in_process, args.repeat)
+            hits = len(in_process())
+            print(f"  {'in-process':>12}  {baseline:8.3f}s  {hits} hits")
+
+            for workers in worker_counts():
+                search = ShardedSearch(workers)
+                try:
+                    # Warm up so every worker has started and mapped the store
+                    ShardedSearch.merge(search.submit(store, mode, query))
+                    elapsed = best_time(lambda: ShardedSearch.merge(search.submit(store, mode, query)),
+                                        args.repeat)
+                finally:
+                    search.terminate()
+                print(f"  {workers:>4} workers  {elapsed:8.3f}s  {baseline / elapsed:5.2f}x")
+            print()
+        store.close()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
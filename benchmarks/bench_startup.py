@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for YouTube Liked Videos Searcher
+Times, in fresh interpreters, importing the module and loading a synthetic
+cache the slow way (parse JSON, derive rows) and from the binary snapshot.
+
+Usage: python benchmarks/bench_startup.py [--videos 100000] [--repeat 3]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, SRC_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def phase_import(workdir):
+    import youtube_searcher  # noqa: F401
+    heavy = [name for name in ('googleapiclient', 'google_auth_oauthlib', 'numpy') if name in sys.modules]
+    return f"heavy modules loaded: {', '.join(heavy) or 'none'}"
+
+
+def phase_json(workdir):
+    """Mirror load_cache without a snapshot: hash, parse, open the store, format every row"""
+    import youtube_searcher as ys
+    cache_file = os.path.join(workdir, 'cache.json')
+    cache_hash = ys.file_sha1(cache_file)
+    with open(cache_file, 'rb') as f:
+        videos = json.loads(f.read())
+    store = ys.DescriptionStore(os.path.join(workdir, 'descriptions.bin'))
+    assert store.open() and store.source_hash == cache_hash
+    for video in videos:
+        video['description'] = None
+    rows = [ys.format_tree_row(video, store.get(video['id'], 201)) for video in videos]
+    return f"{len(rows)} rows"
+
+
+def phase_snapshot(workdir):
+    """Mirror load_cache with a valid snapshot: hash, read the snapshot, open the store"""
+    import youtube_searcher as ys
+    cache_hash = ys.file_sha1(os.path.join(workdir, 'cache.json'))
+    payload = ys.read_snapshot(os.path.join(workdir, 'index.snapshot'), cache_hash)
+    assert payload is not None
+    store = ys.DescriptionStore(os.path.join(workdir, 'descriptions.bin'))
+    assert store.open() and store.source_hash == cache_hash
+    ids = [video['id'] for video in payload['videos']]
+    rows = dict(zip(ids, payload['rows']))
+    return f"{len(rows)} rows"
+
+
+PHASES = {
+    'import': phase_import,
+    'json': phase_json,
+    'snapshot': phase_snapshot,
+}
+
+
+def prepare(workdir, count):
+    """Write a synthetic cache with its description store and snapshot"""
+    import youtube_searcher as ys
+    from bench_search import make_videos
+
+    videos = make_videos(count)
+    with open(os.path.join(workdir, 'cache.json'), 'wb') as f:
+        cache_hash = ys.write_videos_json(f, videos)
+    store = ys.DescriptionStore(os.path.join(workdir, 'descriptions.bin'))
+    store.rebuild(videos, lambda video: video['description'], cache_hash)
+
+    rows = [ys.format_tree_row(video, store.get(video['id'], 201)) for video in videos]
+    sort_index = ys.build_sort_index(rows)
+    for video in videos:
+        video['description'] = None
+    ys.write_snapshot(os.path.join(workdir, 'index.snapshot'), cache_hash, {
+        'videos': videos,
+        'rows': rows,
+        'sort': {column: sort_index[column].tobytes() for column in ys.SORT_COLUMNS},
+    })
+    store.close()
+
+
+def run_phase(phase, workdir):
+    """Time a phase in a fresh interpreter, including interpreter startup"""
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), '--phase', phase, '--dir', workdir],
+                            check=True, capture_output=True, text=True).stdout.strip()
+    return time.perf_counter() - start, output
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--videos', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--phase', choices=PHASES, help=argparse.SUPPRESS)
+    parser.add_argument('--dir', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.phase:
+        print(PHASES[args.phase](args.dir))
+        return
+
+    workdir = tempfile.mkdtemp(prefix='yls_bench_')
+    try:
+        print(f"Preparing cache for {args.videos} synthetic videos...")
+        prepare(workdir, args.videos)
+        print(f"Cache: {os.path.getsize(os.path.join(workdir, 'cache.json')) / 1e6:.1f} MB, "
+              f"snapshot: {os.path.getsize(os.path.join(workdir, 'index.snapshot')) / 1e6:.1f} MB")
+        print()
+
+        print("Cold start (fresh interpreter, best of %d)" % args.repeat)
+        for phase, label in (('import', 'import module'), ('json', 'load from JSON'),
+                             ('snapshot', 'load from snapshot')):
+            timings = [run_phase(phase, workdir) for _ in range(args.repeat)]
+            elapsed, output = min(timings)
+            print(f"  {label:>20}  {elapsed:8.3f}s  {output}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
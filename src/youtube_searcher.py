@@ -11,15 +11,1175 @@ import os
 import webbrowser
 from datetime import datetime
 import re
-try:
-    from googleapiclient.discovery import build
-    from google_auth_oauthlib.flow import InstalledAppFlow
-    from google.auth.transport.requests import Request
-    from google.oauth2.credentials import Credentials
-except ImportError:
-    print("Please install required packages:")
-    print("pip install google-api-python-client google-auth google-auth-oauthlib")
-    exit(1)
+import difflib
+import hashlib
+import heapq
+import marshal
+import math
+import mmap
+import multiprocessing
+import struct
+import sys
+import zlib
+from array import array
+from bisect import bisect_right
+from collections import Counter, deque
+from functools import lru_cache
+
+# Google API client, OAuth stack and NumPy are slow to import, so they are
+# only loaded once a feature needs them (see import_google_libraries / import_numpy)
+build = InstalledAppFlow = Request = Credentials = None
+np = None
+
+
+def import_google_libraries():
+    """Import the YouTube API client and OAuth libraries on first use"""
+    global build, InstalledAppFlow, Request, Credentials
+    if build is None:
+        try:
+            from googleapiclient.discovery import build as api_build
+            from google_auth_oauthlib.flow import InstalledAppFlow as flow_class
+            from google.auth.transport.requests import Request as request_class
+            from google.oauth2.credentials import Credentials as credentials_class
+        except ImportError:
+            raise ImportError("Please install required packages:\n"
+                              "pip install google-api-python-client google-auth google-auth-oauthlib")
+        # Only published once every import succeeded
+        build, InstalledAppFlow, Request, Credentials = \
+            api_build, flow_class, request_class, credentials_class
+
+
+def import_numpy():
+    """Import NumPy on first use, returning False if it is not installed"""
+    global np
+    if np is None:
+        try:
+            import numpy as np
+        except ImportError:
+            return False  # Semantic search is unavailable without NumPy
+    return True
+
+# Semantic search settings
+EMBEDDING_DIM = 128             # Latent dimensions kept from the SVD
+EMBEDDING_MAX_CHARS = 4000      # Only the start of long descriptions is embedded
+EMBEDDING_BATCH_SIZE = 500
+EMBEDDING_BATCHES_IN_FLIGHT = 2 # Per worker; the rest are submitted as these finish
+LSA_VOCABULARY_SIZE = 20000     # Terms kept, by how many videos use them
+LSA_FIT_MAX_DOCS = 10000        # Larger libraries are fitted on an evenly spread sample
+LSA_REFIT_GROWTH = 1.5          # Refit once the library has grown this much since the last fit
+LSA_POWER_ITERATIONS = 3
+SEMANTIC_MIN_SCORE = 0.3
+SEMANTIC_MAX_RESULTS = 500
+
+# Regex/fuzzy search settings
+FUZZY_CUTOFF = 0.75                 # Minimum similarity for a query word to count as matched
+SEARCH_DEBOUNCE_MS = 300
+# Smaller libraries are searched as a single shard; fuzzy scoring is far slower per video
+PARALLEL_SEARCH_MIN_VIDEOS = {'Regex': 20000, 'Fuzzy': 2000}
+SEARCH_SHARDS_PER_WORKER = 4        # More shards balance load and allow earlier cancellation
+SEARCH_CANCEL_CHECK_INTERVAL = 256
+SEARCH_TERMINATE_AFTER_MS = 500     # Workers still busy this long after a cancel are killed
+
+_TOKEN_RE = re.compile(r"[^\W_]+")
+_STOP_WORDS = frozenset("""
+a an and are as at be by for from has have how i in is it its of on or that the this
+to was what when where which who why will with you your we our my me
+""".split())
+
+
+def content_hash(video, description=None):
+    """Return a stable hash of the fields that make up a video's searchable content"""
+    if description is None:
+        description = video.get('description', '')
+    digest = hashlib.sha1()
+    for field in (video['title'], video['channel'], description):
+        digest.update(field.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=65536)
+def _stem(token):
+    """Strip common English endings so "compilers", "compiler" and "compile" are one term"""
+    if len(token) > 4 and not token.endswith('ss'):
+        if token.endswith('ies'):
+            return token[:-3] + 'y'
+        for suffix in ('ing', 'ers', 'ed', 'er', 'es', 'e', 's'):
+            if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+                return token[:-len(suffix)]
+    return token
+
+
+def text_terms(text):
+    """Count the stemmed terms of a text, leaving out stop words and single characters"""
+    return Counter(_stem(token) for token in _TOKEN_RE.findall(text[:EMBEDDING_MAX_CHARS].lower())
+                   if token not in _STOP_WORDS and len(token) > 1)
+
+
+def _csr_matmul(indptr, indices, data, dense, chunk_rows=256):
+    """Multiply a sparse CSR matrix by a dense one, a few rows at a time to bound memory"""
+    rows = len(indptr) - 1
+    out = np.zeros((rows, dense.shape[1]), dtype=np.float32)
+    for start in range(0, rows, chunk_rows):
+        end = min(start + chunk_rows, rows)
+        lo, hi = indptr[start], indptr[end]
+        if lo == hi:
+            continue
+        products = dense[indices[lo:hi]] * data[lo:hi, None]
+        # reduceat cannot express empty rows, so they are skipped and stay zero
+        nonempty = np.flatnonzero(indptr[start + 1:end + 1] > indptr[start:end])
+        out[start + nonempty] = np.add.reduceat(products, indptr[start + nonempty] - lo, axis=0)
+    return out
+
+
+class SemanticModel:
+    """Latent semantic analysis fitted on the library
+
+    Videos are weighted TF-IDF vectors over the library's most common terms,
+    projected onto the top singular vectors of the video-term matrix. Terms
+    that tend to appear together in the library (say "pasta", "recipe" and
+    "italian") share directions, so a query can match videos that use related
+    words instead of its exact ones.
+    """
+
+    def __init__(self, terms, idf, components, docs):
+        self.terms = list(terms)
+        self.term_index = {term: i for i, term in enumerate(self.terms)}
+        self.idf = idf
+        self.components = components
+        self.docs = docs
+        self.model_id = hashlib.sha1(components.tobytes()).hexdigest()[:16]
+
+    @property
+    def dim(self):
+        return self.components.shape[1]
+
+    def tfidf(self, text):
+        """Return the (term indices, weights) of a text's normalized sublinear TF-IDF vector"""
+        counts = [(self.term_index[term], count) for term, count in text_terms(text).items()
+                  if term in self.term_index]
+        if not counts:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        indices = np.array([i for i, _ in counts], dtype=np.int64)
+        weights = (1.0 + np.log(np.array([c for _, c in counts], dtype=np.float32))) * self.idf[indices]
+        return indices, weights / np.linalg.norm(weights)
+
+    def embed(self, text):
+        """Project a text into the latent space, normalized for cosine similarity"""
+        indices, weights = self.tfidf(text)
+        vector = weights @ self.components[indices] if len(indices) else np.zeros(self.dim, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
+
+    @classmethod
+    def fit(cls, texts):
+        """Fit TF-IDF weights and a truncated SVD (randomized, with power iterations) on texts"""
+        counts = [text_terms(text) for text in texts]
+        docs = len(counts)
+        df = Counter()
+        for terms in counts:
+            df.update(terms.keys())
+        # Terms in a single video link nothing; terms in most videos carry no topic
+        min_df, max_df = (2, docs // 2) if docs >= 20 else (1, docs)
+        terms = [term for term, count in df.most_common() if min_df <= count <= max_df][:LSA_VOCABULARY_SIZE]
+        term_index = {term: i for i, term in enumerate(terms)}
+        idf = np.array([math.log((1 + docs) / (1 + df[term])) + 1.0 for term in terms], dtype=np.float32)
+
+        indptr = [0]
+        indices = []
+        data = []
+        for doc in counts:
+            row = [(term_index[term], count) for term, count in doc.items() if term in term_index]
+            weights = [(1.0 + math.log(count)) * idf[i] for i, count in row]
+            norm = math.sqrt(sum(w * w for w in weights)) or 1.0
+            indices.extend(i for i, _ in row)
+            data.extend(w / norm for w in weights)
+            indptr.append(len(indices))
+        indptr = np.array(indptr, dtype=np.int64)
+        indices = np.array(indices, dtype=np.int64)
+        data = np.array(data, dtype=np.float32)
+
+        # The transpose, for products with the term side of the matrix
+        order = np.argsort(indices, kind='stable')
+        t_indptr = np.concatenate(([0], np.cumsum(np.bincount(indices, minlength=len(terms)))))
+        t_indices = np.repeat(np.arange(docs), np.diff(indptr))[order]
+        t_data = data[order]
+
+        # Far fewer dimensions than terms, or related terms would not be merged
+        dim = max(1, min(EMBEDDING_DIM, min(docs, len(terms)) // 10))
+        width = min(dim + 10, docs, len(terms))
+        if width == 0:
+            return cls(terms, idf, np.zeros((len(terms), dim), dtype=np.float32), docs)
+        rng = np.random.default_rng(0)
+        sample = _csr_matmul(indptr, indices, data, rng.standard_normal((len(terms), width)).astype(np.float32))
+        for _ in range(LSA_POWER_ITERATIONS):
+            basis = np.linalg.qr(sample)[0]
+            basis = np.linalg.qr(_csr_matmul(t_indptr, t_indices, t_data, basis))[0]
+            sample = _csr_matmul(indptr, indices, data, basis)
+        basis = np.linalg.qr(sample)[0]
+        projected = _csr_matmul(t_indptr, t_indices, t_data, basis).T  # basis.T @ X
+        components = np.linalg.svd(projected, full_matrices=False)[2][:dim].T
+        return cls(terms, idf, np.ascontiguousarray(components, dtype=np.float32), docs)
+
+    def save(self, path):
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, terms=np.array(self.terms, dtype=str), idf=self.idf,
+                     components=self.components, docs=np.array(self.docs))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Load a saved model, or return None if there is none"""
+        if not os.path.exists(path):
+            return None
+        with np.load(path, allow_pickle=False) as saved:
+            return cls(saved['terms'].tolist(), saved['idf'], saved['components'], int(saved['docs']))
+
+
+def embedding_text(title, channel, description):
+    """Text used to embed a video; the title is repeated to weigh it above the description"""
+    return f"{title}\n{title}\n{channel}\n{description}"
+
+
+def _embedding_texts(store_path, source_hash, items):
+    """Texts of a batch of embedding items: a description store row is read from
+    the worker's map of the store, any other item is the text itself"""
+    store = None
+    texts = []
+    for item in items:
+        if isinstance(item, int):
+            if store is None:
+                store = _open_worker_store(store_path, source_hash)
+            texts.append(store.embedding_text(item))
+        else:
+            texts.append(item)
+    return texts
+
+
+def fit_semantic_model(store_path, source_hash, items):
+    """Fit the semantic model on a sample of videos (runs in a worker process)"""
+    import_numpy()
+    return SemanticModel.fit(_embedding_texts(store_path, source_hash, items))
+
+
+# Per-worker model for embedding
+_worker_model = None
+
+
+def embed_batch(store_path, source_hash, model_path, model_id, items):
+    """Embed a batch of videos with the saved model (runs in a worker process)
+
+    Videos whose description is in the store are sent as their row, so the
+    texts are only decoded here, one batch at a time.
+    """
+    global _worker_model
+    import_numpy()
+    if _worker_model is None or _worker_model.model_id != model_id:
+        _worker_model = SemanticModel.load(model_path)
+        if _worker_model is None or _worker_model.model_id != model_id:
+            raise RuntimeError("Semantic model changed while embedding")
+    texts = _embedding_texts(store_path, source_hash, items)
+    matrix = np.zeros((len(texts), _worker_model.dim), dtype=np.float32)
+    for row, text in enumerate(texts):
+        matrix[row] = _worker_model.embed(text)
+    return matrix
+
+
+class SemanticIndex:
+    """Memory-mapped float32 matrix of video embeddings stored next to the cache,
+    with the semantic model that produced them
+
+    Rows are not kept in library order, so updates touch only the rows that
+    changed: a changed video's row is overwritten in place and new videos take
+    spare rows left at the end of the file. Rows of videos that are gone are
+    listed with a None id and skipped until more than half the rows are unused
+    or the spare rows run out, when the matrix is written again.
+    """
+
+    VERSION = 3
+    SPARE_ROWS = 0.25  # Rows left for new videos, as a fraction of those used
+
+    def __init__(self, matrix_file, index_file, model_file):
+        self.matrix_file = matrix_file
+        self.index_file = index_file
+        self.model_file = model_file
+        self.model = None
+        self.ids = []
+        self.hashes = []
+        self.current = {}
+        self.unused_rows = []
+        self.matrix = None
+
+    def load(self):
+        """Open the model and on-disk index, discarding an index built by another model"""
+        self.close()
+        try:
+            self.model = SemanticModel.load(self.model_file)
+            if self.model and os.path.exists(self.index_file) and os.path.exists(self.matrix_file):
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    meta = json.load(f)
+                if meta.get('version') != self.VERSION or meta.get('model') != self.model.model_id:
+                    return
+                matrix = np.load(self.matrix_file, mmap_mode='r')
+                if matrix.shape[0] < len(meta['ids']) or matrix.shape[1:] != (self.model.dim,):
+                    return
+                self.ids = meta['ids']
+                self.hashes = meta['hashes']
+                self.current = {video_id: h for video_id, h in zip(self.ids, self.hashes) if video_id is not None}
+                self.unused_rows = [row for row, video_id in enumerate(self.ids) if video_id is None]
+                self.matrix = matrix
+        except Exception as e:
+            print(f"Failed to load semantic index: {e}")
+            self.close()
+
+    def close(self):
+        """Release the memory map so the files can be replaced"""
+        self.ids = []
+        self.hashes = []
+        self.current = {}
+        self.unused_rows = []
+        self.matrix = None
+
+    def set_model(self, model):
+        """Switch to a newly fitted model; every video has to be embedded again"""
+        model.save(self.model_file)
+        self.close()
+        self.model = model
+
+    def is_current(self, ids, hashes):
+        """Check whether the index covers exactly these videos"""
+        return self.matrix is not None and len(self.current) == len(ids) and self.current == dict(zip(ids, hashes))
+
+    def missing_rows(self, ids, hashes):
+        """Return positions of videos whose embedding is absent or out of date"""
+        return [i for i, (video_id, h) in enumerate(zip(ids, hashes)) if self.current.get(video_id) != h]
+
+    def write(self, ids, hashes, computed):
+        """Add freshly computed rows for the videos in ids and drop rows of videos not in it
+
+        computed maps a position in ids to its embedding vector. Videos with
+        neither a computed nor an up-to-date existing row are left out, so an
+        interrupted build keeps the rows it finished.
+        """
+        wanted = dict(zip(ids, hashes))
+        row_ids = [video_id if video_id is not None and wanted.get(video_id) == self.current.get(video_id) else None
+                   for video_id in self.ids]
+        row_hashes = [self.hashes[row] if video_id is not None else None for row, video_id in enumerate(row_ids)]
+        rows = {video_id: row for row, video_id in enumerate(self.ids) if video_id is not None}
+
+        # A changed video keeps its row; a new one is appended, never given a row the
+        # index on disk still lists, so an interrupted write cannot mislabel a row
+        patches = []
+        for i, vector in computed.items():
+            row = rows.get(ids[i])
+            if row is None:
+                row = len(row_ids)
+                row_ids.append(None)
+                row_hashes.append(None)
+            row_ids[row] = ids[i]
+            row_hashes[row] = hashes[i]
+            patches.append((row, vector))
+
+        live = len(row_ids) - row_ids.count(None)
+        if (self.matrix is not None and len(row_ids) <= self.matrix.shape[0]
+                and len(row_ids) - live <= live):
+            matrix = np.lib.format.open_memmap(self.matrix_file, mode='r+')
+            for row, vector in patches:
+                matrix[row] = vector
+            matrix.flush()
+            del matrix
+        else:
+            row_ids, row_hashes = self._write_matrix(row_ids, row_hashes, dict(patches))
+
+        tmp_index = self.index_file + '.tmp'
+        with open(tmp_index, 'w', encoding='utf-8') as f:
+            json.dump({'version': self.VERSION, 'model': self.model.model_id,
+                       'ids': row_ids, 'hashes': row_hashes}, f)
+        os.replace(tmp_index, self.index_file)
+        self.load()
+
+    def _write_matrix(self, row_ids, row_hashes, patches):
+        """Write the used rows to a new matrix file with spare rows, returning its ids and hashes"""
+        used = [row for row, video_id in enumerate(row_ids) if video_id is not None]
+        tmp_matrix = self.matrix_file + '.tmp'
+        matrix = np.lib.format.open_memmap(tmp_matrix, mode='w+', dtype=np.float32,
+                                           shape=(len(used) + int(len(used) * self.SPARE_ROWS) + 1, self.model.dim))
+        for new_row, row in enumerate(used):
+            matrix[new_row] = patches[row] if row in patches else self.matrix[row]
+        matrix.flush()
+        del matrix
+
+        # The old map has to be dropped before the file can be replaced (Windows)
+        model = self.model
+        self.close()
+        self.model = model
+        os.replace(tmp_matrix, self.matrix_file)
+        return [row_ids[row] for row in used], [row_hashes[row] for row in used]
+
+    def search(self, query, limit=SEMANTIC_MAX_RESULTS, min_score=SEMANTIC_MIN_SCORE):
+        """Return (video_id, score) pairs ranked by cosine similarity to the query"""
+        if self.matrix is None or not self.current:
+            return []
+
+        scores = self.matrix[:len(self.ids)] @ self.model.embed(query)
+        scores[self.unused_rows] = -np.inf
+        limit = min(limit, len(self.current))
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        top = top[np.argsort(-scores[top])]
+        return [(self.ids[i], float(scores[i])) for i in top if scores[i] >= min_score]
+
+
+def write_videos_json(f, videos, spans=None):
+    """Stream videos to a binary file as an indented JSON list and return its SHA-1
+
+    Produces the same output as json.dump(videos, f, indent=2, ensure_ascii=False)
+    without needing every full video (and description) in memory at once. A
+    video may also be given as the bytes of its entry in a file written this
+    way, which are copied unchanged. If spans is a list, the (start, end) file
+    position of every entry is appended to it.
+    """
+    digest = hashlib.sha1()
+    buffer = []
+    buffered = 0
+    pos = 0
+
+    def write(data):
+        # Entries are written and hashed in large chunks rather than one by one
+        nonlocal buffered, pos
+        buffer.append(data)
+        buffered += len(data)
+        pos += len(data)
+        if buffered >= 1 << 20:
+            flush()
+
+    def flush():
+        nonlocal buffered
+        chunk = b''.join(buffer)
+        digest.update(chunk)
+        f.write(chunk)
+        buffer.clear()
+        buffered = 0
+
+    write(b'[')
+    empty = True
+    for video in videos:
+        write(b'\n  ' if empty else b',\n  ')
+        if not isinstance(video, bytes):
+            video = json.dumps(video, indent=2, ensure_ascii=False).replace('\n', '\n  ').encode('utf-8')
+        if spans is not None:
+            spans.append((pos, pos + len(video)))
+        write(video)
+        empty = False
+    write(b']' if empty else b'\n]')
+    flush()
+    return digest.hexdigest()
+
+
+STORE_SEARCH_CHUNK = 1 << 22  # Bytes lowercased at a time by keyword search
+
+
+def _folded_bytes_pattern(query):
+    """Compile a pattern matching the UTF-8 bytes of query in any letter case
+
+    Non-ASCII letters get their upper- and title-case forms as alternatives,
+    since re.IGNORECASE only folds ASCII in bytes patterns.
+    """
+    parts = []
+    for char in query.lower():
+        variants = {char} | {variant for variant in (char.upper(), char.title())
+                              if len(variant) == 1 and variant.lower() == char}
+        if char.isascii() or len(variants) == 1:
+            parts.append(re.escape(char.encode('utf-8')))
+        else:
+            parts.append(b'(?:' + b'|'.join(re.escape(variant.encode('utf-8'))
+                                            for variant in sorted(variants)) + b')')
+    return re.compile(b''.join(parts), re.IGNORECASE)
+
+
+class DescriptionStore:
+    """Descriptions kept in a memory-mapped blob file instead of resident Python strings
+
+    File layout: a fixed header, one UTF-8 "title channel description" record
+    per video, then a footer with the newline-separated video ids, the start
+    and end of every record, the title and channel lengths (to find where the
+    description starts), where each video's entry is in the JSON cache and the
+    SHA-1 content hash of each video. Searches run on the records themselves,
+    matching case-insensitively, so there is no second normalized copy of the
+    text.
+
+    A refresh appends the records of new and changed videos and a new footer,
+    then points the header at it; records no longer listed stay in the file
+    as unused space until the store is rebuilt.
+    """
+
+    MAGIC = b'YLDS'
+    VERSION = 4
+    HASH_SIZE = 20
+    ROW_TABLES_SIZE = 40  # starts, ends, title and channel lengths, cache starts and ends
+    HEADER = struct.Struct('<4sHH40sIQQI')
+
+    def __init__(self, path):
+        self.path = path
+        self.source_hash = None
+        self.ids = []
+        self.rows = {}
+        self._file = None
+        self._mm = None
+
+    def is_open(self):
+        return self._mm is not None
+
+    def open(self):
+        """Map the store file, returning False if it is missing or unreadable"""
+        self.close()
+        try:
+            if not os.path.exists(self.path):
+                return False
+            self._file = open(self.path, 'rb')
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            magic, version, _, source_hash, count, ids_len, footer_start, footer_crc = \
+                self.HEADER.unpack_from(self._mm, 0)
+            footer_end = footer_start + ids_len + (self.ROW_TABLES_SIZE + self.HASH_SIZE) * count
+            if (magic != self.MAGIC or version != self.VERSION or footer_end > len(self._mm)
+                    or zlib.crc32(self._mm[footer_start:footer_end]) != footer_crc):
+                self.close()
+                return False
+
+            pos = footer_start
+            self.ids = self._mm[pos:pos + ids_len].decode('utf-8').split('\n') if count else []
+            pos += ids_len
+            self.starts = array('Q', self._mm[pos:pos + 8 * count])
+            pos += 8 * count
+            self.ends = array('Q', self._mm[pos:pos + 8 * count])
+            pos += 8 * count
+            self.title_lens = array('I', self._mm[pos:pos + 4 * count])
+            pos += 4 * count
+            self.channel_lens = array('I', self._mm[pos:pos + 4 * count])
+            pos += 4 * count
+            self.cache_starts = array('Q', self._mm[pos:pos + 8 * count])
+            pos += 8 * count
+            self.cache_ends = array('Q', self._mm[pos:pos + 8 * count])
+            pos += 8 * count
+            self.hashes_start = pos
+            self.data_end = footer_start
+
+            # Records in file order, to find which one a search hit falls in
+            self.file_order = sorted(range(count), key=self.starts.__getitem__)
+            self.file_order_starts = [self.starts[row] for row in self.file_order]
+
+            self.rows = {video_id: row for row, video_id in enumerate(self.ids)}
+            self.source_hash = source_hash.decode('ascii')
+            return True
+        except Exception as e:
+            print(f"Failed to open description store: {e}")
+            self.close()
+            return False
+
+    def close(self):
+        """Unmap the store so the file can be replaced or deleted"""
+        if self._mm is not None:
+            self._mm.close()
+        if self._file is not None:
+            self._file.close()
+        self._mm = None
+        self._file = None
+        self.source_hash = None
+        self.ids = []
+        self.rows = {}
+
+    def __contains__(self, video_id):
+        return video_id in self.rows
+
+    def description_start(self, row):
+        """File position where a record's description starts, after "title channel " """
+        return self.starts[row] + self.title_lens[row] + self.channel_lens[row] + 2
+
+    def get(self, video_id, max_chars=None):
+        """Decode a video's description, or just its first max_chars characters"""
+        return self._description(self.rows[video_id], max_chars)
+
+    def _description(self, row, max_chars=None):
+        start = self.description_start(row)
+        end = self.ends[row]
+        if max_chars is None:
+            return self._mm[start:end].decode('utf-8')
+        # A character is at most 4 bytes; a character cut in half at the end is dropped
+        end = min(end, start + 4 * max_chars)
+        return self._mm[start:end].decode('utf-8', errors='ignore')[:max_chars]
+
+    def cache_span(self, video_id):
+        """Return where a video's entry is in the JSON cache the store was built from, if known"""
+        row = self.rows[video_id]
+        if not self.cache_ends[row]:
+            return None
+        return self.cache_starts[row], self.cache_ends[row]
+
+    def embedding_text(self, row):
+        """Build a record's embedding_text(), reading only the start of a long description"""
+        start = self.starts[row]
+        title_end = start + self.title_lens[row]
+        channel_end = title_end + 1 + self.channel_lens[row]
+        return embedding_text(self._mm[start:title_end].decode('utf-8'),
+                              self._mm[title_end + 1:channel_end].decode('utf-8'),
+                              self._description(row, EMBEDDING_MAX_CHARS))
+
+    def content_hash(self, video_id):
+        """Return the content_hash() recorded for a video when the store was built"""
+        start = self.hashes_start + self.HASH_SIZE * self.rows[video_id]
+        return self._mm[start:start + self.HASH_SIZE].hex()
+
+    def folded_text(self, row):
+        """Decode the "title channel description" text of a record, lowercased"""
+        return self._mm[self.starts[row]:self.ends[row]].decode('utf-8').lower()
+
+    def _finder(self, query):
+        """Return a function giving the (start, end) of the next match of query at or after a
+        file position, ignoring case, or None once there are no more"""
+        needle = query.lower().encode('utf-8')
+        if not needle.isascii():
+            pattern = _folded_bytes_pattern(query)
+
+            def find(pos):
+                match = pattern.search(self._mm, pos, self.data_end)
+                return match.span() if match else None
+            return find
+
+        # bytes.lower() on a chunk and find() are far faster than an IGNORECASE
+        # pattern; chunks overlap by len(needle) - 1 so no match is split
+        chunk = [None, b'']
+
+        def find(pos):
+            while pos < self.data_end:
+                if chunk[0] is None or not chunk[0] <= pos < chunk[0] + STORE_SEARCH_CHUNK:
+                    chunk[0] = pos
+                    chunk[1] = self._mm[pos:min(self.data_end, pos + STORE_SEARCH_CHUNK + len(needle) - 1)].lower()
+                hit = chunk[1].find(needle, pos - chunk[0])
+                if hit >= 0:
+                    return chunk[0] + hit, chunk[0] + hit + len(needle)
+                pos = chunk[0] + STORE_SEARCH_CHUNK
+            return None
+        return find
+
+    def search(self, query):
+        """Return ids of videos whose title, channel or description contain query, ignoring case"""
+        find = self._finder(query)
+        starts = self.file_order_starts
+        matches = set()
+        pos = self.HEADER.size
+        while True:
+            span = find(pos)
+            if span is None:
+                break
+            i = bisect_right(starts, span[0]) - 1
+            row = self.file_order[i] if i >= 0 else None
+            if row is not None and span[1] <= self.ends[row]:
+                matches.add(self.ids[row])
+                # One hit per video is enough; continue from the next record
+                pos = self.ends[row]
+            elif row is not None and span[0] < self.ends[row]:
+                pos = span[0] + 1  # The hit runs into the next record
+            elif i + 1 < len(starts):
+                pos = starts[i + 1]
+            else:
+                break
+        return matches
+
+    def rebuild(self, videos, get_description, source_hash, cache_spans=None):
+        """Write a new store for videos and map it in place of the current one
+
+        cache_spans gives the (start, end) of each video's entry in the JSON
+        cache, if known.
+        """
+        tmp_path = self.path + '.tmp'
+        tables = self._new_tables()
+
+        try:
+            with open(tmp_path, 'wb') as out:
+                # The header is filled in once the footer has been written
+                out.write(b'\0' * self.HEADER.size)
+                for i, video in enumerate(videos):
+                    self._append_record(out, tables, video, get_description(video),
+                                        cache_spans[i] if cache_spans else (0, 0))
+                self._write_footer(out, [video['id'] for video in videos], tables, source_hash)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        # The old store stays mapped until the new file is in place, since cached
+        # videos may have no other copy of their description
+        try:
+            try:
+                os.replace(tmp_path, self.path)
+            except PermissionError:
+                # Windows cannot replace a mapped file; release the map and retry
+                self.close()
+                os.replace(tmp_path, self.path)
+        except OSError:
+            if not self.is_open():
+                self.open()  # Map the old file again
+            os.remove(tmp_path)
+            raise
+        return self.open()
+
+    def update(self, videos, source_hash, cache_spans):
+        """Bring the store up to date with videos by appending records only for
+        the new and changed ones, and rewriting the footer tables and header
+
+        Videos whose description is None keep their current record. The old
+        records and footer are left untouched and the header is written last, so
+        an interrupted update leaves the previous store intact. Returns False
+        without writing anything if the store is not open, lacks a kept video or
+        would end up mostly unused space; it has to be rebuilt then.
+        """
+        if not self.is_open():
+            return False
+        rows = []  # Current row of each kept video, None for those appended
+        kept_bytes = 0
+        appended_chars = 0
+        for video in videos:
+            if video['description'] is not None:
+                rows.append(None)
+                appended_chars += len(video['title']) + len(video['channel']) + len(video['description'])
+            elif video['id'] in self.rows:
+                row = self.rows[video['id']]
+                rows.append(row)
+                kept_bytes += self.ends[row] - self.starts[row]
+            else:
+                return False
+        # Character counts stand in for the encoded size of the appended records
+        if len(self._mm) - self.HEADER.size - kept_bytes > kept_bytes + appended_chars:
+            return False
+
+        appended = self._new_tables()
+        hash_size = self.HASH_SIZE
+        with open(self.path, 'r+b') as out:
+            out.seek(0, os.SEEK_END)
+            for video, row, cache_span in zip(videos, rows, cache_spans):
+                if row is None:
+                    self._append_record(out, appended, video, video['description'], cache_span)
+
+            # Kept videos take their entries from the current tables
+            tables = []
+            for current, fresh in zip((self.starts, self.ends, self.title_lens, self.channel_lens), appended):
+                fresh = iter(fresh)
+                tables.append(array(current.typecode,
+                                    [current[row] if row is not None else next(fresh) for row in rows]))
+            tables.append(array('Q', [start for start, _ in cache_spans]))
+            tables.append(array('Q', [end for _, end in cache_spans]))
+            fresh = iter([appended[-1][i:i + hash_size] for i in range(0, len(appended[-1]), hash_size)])
+            with memoryview(self._mm) as mapped:
+                current = mapped[self.hashes_start:self.hashes_start + hash_size * len(self.ids)]
+                tables.append(b''.join([current[row * hash_size:(row + 1) * hash_size] if row is not None
+                                        else next(fresh) for row in rows]))
+                current.release()
+            self._write_footer(out, [video['id'] for video in videos], tables, source_hash)
+        return self.open()
+
+    @staticmethod
+    def _new_tables():
+        """Empty footer tables: starts, ends, title and channel lengths, cache spans and hashes"""
+        return array('Q'), array('Q'), array('I'), array('I'), array('Q'), array('Q'), bytearray()
+
+    def _append_record(self, out, tables, video, description, cache_span):
+        starts, ends, title_lens, channel_lens, cache_starts, cache_ends, hashes = tables
+        hashes += bytes.fromhex(content_hash(video, description))
+        title = video['title'].encode('utf-8')
+        channel = video['channel'].encode('utf-8')
+        starts.append(out.tell())
+        out.write(b' '.join((title, channel, description.encode('utf-8'))))
+        ends.append(out.tell())
+        title_lens.append(len(title))
+        channel_lens.append(len(channel))
+        cache_starts.append(cache_span[0])
+        cache_ends.append(cache_span[1])
+
+    def _write_footer(self, out, ids, tables, source_hash):
+        """Write the footer at the current position, then the header pointing at it"""
+        ids_blob = '\n'.join(ids).encode('utf-8')
+        footer_start = out.tell()
+        footer = b''.join((ids_blob, *tables))
+        out.write(footer)
+        out.flush()
+        out.seek(0)
+        out.write(self.HEADER.pack(self.MAGIC, self.VERSION, 0, source_hash.encode('ascii'),
+                                   len(ids), len(ids_blob), footer_start, zlib.crc32(footer)))
+
+
+# Startup snapshot of prebuilt display rows and sort indexes
+SNAPSHOT_MAGIC = b'YLIS'
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct('<4sH24s40s')
+SORT_COLUMNS = ('title', 'channel', 'date', 'description')
+
+
+def file_sha1(path):
+    """SHA-1 of a file, read in chunks"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _snapshot_tag():
+    # marshal's format is only guaranteed stable within one Python version
+    return f"{sys.implementation.name}-{sys.version_info[0]}.{sys.version_info[1]}-{marshal.version}".encode('ascii')
+
+
+def write_snapshot(path, cache_hash, payload):
+    """Write a marshal snapshot that is only valid for the cache with this hash"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, _snapshot_tag(),
+                                     cache_hash.encode('ascii')))
+        f.write(marshal.dumps(payload))
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path, cache_hash):
+    """Return a snapshot's payload, or None if it is missing, outdated or built for another cache"""
+    try:
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            header = f.read(SNAPSHOT_HEADER.size)
+            if len(header) != SNAPSHOT_HEADER.size:
+                return None
+            magic, version, tag, snapshot_hash = SNAPSHOT_HEADER.unpack(header)
+            if (magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION
+                    or tag.rstrip(b'\0') != _snapshot_tag()
+                    or snapshot_hash.decode('ascii') != cache_hash):
+                return None
+            payload = marshal.loads(f.read())
+        if len(payload['videos']) != len(payload['rows']):
+            return None
+        return payload
+    except Exception as e:
+        print(f"Failed to read snapshot: {e}")
+        return None
+
+
+def format_tree_row(video, description):
+    """Format a video as a row of the results treeview
+
+    Only the first 201 characters of the description are needed.
+    """
+    # Format date
+    try:
+        date_obj = datetime.fromisoformat(video['published_at'].replace('Z', '+00:00'))
+        formatted_date = date_obj.strftime('%Y-%m-%d')
+    except:
+        formatted_date = video['published_at'][:10]
+    
+    # Truncate description for display
+    description = description[:200] + ('...' if len(description) > 200 else '')
+    # Remove newlines from description for better display
+    description = description.replace('\n', ' ').replace('\r', '')
+    
+    return (
+        video['title'][:100] + ('...' if len(video['title']) > 100 else ''),
+        video['channel'],
+        formatted_date,
+        description
+    )
+
+
+SORT_KEYS = {
+    'title': lambda row: row[0].lower(),
+    'channel': lambda row: row[1].lower(),
+    'date': lambda row: row[2],  # YYYY-MM-DD sorts chronologically as text
+    'description': lambda row: row[3].lower(),
+}
+
+
+def build_sort_index(rows):
+    """Rank rows by every sortable column so sorting the table is an integer comparison"""
+    index = {}
+    for column in SORT_COLUMNS:
+        key = SORT_KEYS[column]
+        ranks = array('I', bytes(4 * len(rows)))
+        for rank, i in enumerate(sorted(range(len(rows)), key=lambda i: key(rows[i]))):
+            ranks[i] = rank
+        index[column] = ranks
+    return index
+
+
+def update_sort_index(index, videos, row, stale_ids):
+    """Carry a sort index over to a changed library without sorting it again
+
+    index ranks the previous library, with 'positions' giving each video's
+    position in it. videos is the new library and stale_ids the videos whose
+    rows changed or are gone. New and changed videos are inserted into each
+    column's order by binary search, so row(video) only formats them and the
+    few rows they are compared against. Returns None when so much changed
+    that the index is better built again.
+    """
+    old_positions = index['positions']
+    fresh = [video for video in videos if video['id'] in stale_ids or video['id'] not in old_positions]
+    if len(fresh) * 16 > len(videos):
+        return None
+
+    positions = {video['id']: i for i, video in enumerate(videos)}
+    old_ids = [None] * len(old_positions)
+    for video_id, i in old_positions.items():
+        old_ids[i] = video_id
+    rows = {}
+
+    def row_of(video_id):
+        if video_id not in rows:
+            rows[video_id] = row(videos[positions[video_id]])
+        return rows[video_id]
+
+    new_index = {'positions': positions}
+    for column in SORT_COLUMNS:
+        key = SORT_KEYS[column]
+        order = [None] * len(old_ids)
+        for i, rank in enumerate(index[column]):
+            order[rank] = old_ids[i]
+        order = [video_id for video_id in order if video_id in positions and video_id not in stale_ids]
+
+        # Ties keep library order, as in build_sort_index
+        for video in fresh:
+            target = (key(row_of(video['id'])), positions[video['id']])
+            low, high = 0, len(order)
+            while low < high:
+                middle = (low + high) // 2
+                if (key(row_of(order[middle])), positions[order[middle]]) < target:
+                    low = middle + 1
+                else:
+                    high = middle
+            order.insert(low, video['id'])
+
+        ranks = array('I', bytes(4 * len(videos)))
+        for rank, video_id in enumerate(order):
+            ranks[positions[video_id]] = rank
+        new_index[column] = ranks
+    return new_index
+
+
+class LibraryDiff:
+    """Compares videos fetched from YouTube against the cached library by content hash"""
+
+    def __init__(self, cached_videos, cached_hash):
+        self.cached = {video['id']: video for video in cached_videos}
+        self.cached_hash = cached_hash
+        self.videos = []
+        self.added = []
+        self.changed = []  # (cached video, fetched video) pairs
+        self.removed = []
+        self._seen = set()
+
+    def add_page(self, fetched_videos):
+        """Classify a page of fetched videos as it arrives"""
+        for video in fetched_videos:
+            if video['id'] in self._seen:
+                continue
+            self._seen.add(video['id'])
+
+            cached = self.cached.get(video['id'])
+            if cached is None:
+                self.added.append(video)
+            elif content_hash(video) != self.cached_hash(cached):
+                self.changed.append((cached, video))
+            else:
+                # Keep the cached entry so its description can stay in the store
+                video = cached
+            self.videos.append(video)
+
+    def finish(self):
+        """Mark cached videos that were not fetched as removed (unliked, deleted or private)"""
+        self.removed = [video for video_id, video in self.cached.items() if video_id not in self._seen]
+
+    def is_empty(self):
+        return not (self.added or self.changed or self.removed)
+
+    def summary(self, get_description):
+        """Describe the changes in a form that can be saved as JSON"""
+        def brief(video):
+            return {'id': video['id'], 'title': video['title'], 'channel': video['channel']}
+
+        changed = []
+        for cached, video in self.changed:
+            fields = {field: [cached[field], video[field]]
+                      for field in ('title', 'channel') if cached[field] != video[field]}
+            if get_description(cached) != video['description']:
+                fields['description'] = True
+            changed.append(dict(brief(video), fields=fields))
+
+        return {
+            'time': datetime.now().isoformat(timespec='seconds'),
+            'added': [brief(video) for video in self.added],
+            'removed': [brief(video) for video in self.removed],
+            'changed': changed,
+        }
+
+
+def fuzzy_score(query_words, text):
+    """Score how well every query word approximately matches some word in text (0 if any is missing)"""
+    words = None
+    total = 0.0
+    for query_word in query_words:
+        if query_word in text:
+            total += 1.0
+            continue
+        if words is None:
+            words = set(_TOKEN_RE.findall(text))
+        close = difflib.get_close_matches(query_word, words, n=1, cutoff=FUZZY_CUTOFF)
+        if not close:
+            return 0.0
+        total += difflib.SequenceMatcher(None, query_word, close[0]).ratio()
+    return total / len(query_words)
+
+
+def match_records(records, mode, query, is_cancelled=None):
+    """Match (row, lowercased text) records against a regex or fuzzy query
+
+    Returns (sort key, row) pairs sorted best first so partial results from
+    several shards can be combined with heapq.merge, or None if cancelled.
+    """
+    results = []
+    if mode == 'Regex':
+        pattern = re.compile(query, re.IGNORECASE)
+
+        def score(text):
+            return 1.0 if pattern.search(text) else 0.0
+    else:
+        query_words = _TOKEN_RE.findall(query.lower()) or [query.lower()]
+
+        def score(text):
+            return fuzzy_score(query_words, text)
+
+    for count, (row, text) in enumerate(records):
+        if is_cancelled and count % SEARCH_CANCEL_CHECK_INTERVAL == 0 and is_cancelled():
+            return None
+        value = score(text)
+        if value:
+            # Regex hits keep library order; fuzzy hits are ranked by similarity
+            results.append((0.0 if mode == 'Regex' else -value, row))
+    results.sort()
+    return results
+
+
+# Per-worker state for sharded search and embedding
+_search_generation = None
+_worker_store = None
+
+
+def _init_search_worker(generation):
+    global _search_generation
+    _search_generation = generation
+
+
+def _open_worker_store(path, source_hash):
+    """Return this worker's map of a description store, mapping it again if the store changed
+
+    The store file is mapped once per worker and shared through the page cache,
+    so tasks only need to send row numbers.
+    """
+    global _worker_store
+    if _worker_store is None or _worker_store.path != path or _worker_store.source_hash != source_hash:
+        if _worker_store is not None:
+            _worker_store.close()
+        _worker_store = DescriptionStore(path)
+        if not _worker_store.open() or _worker_store.source_hash != source_hash:
+            raise RuntimeError("Description store changed while reading it")
+    return _worker_store
+
+
+def search_shard(path, source_hash, start, end, mode, query, generation):
+    """Search records [start, end) of a description store (runs in a worker process)"""
+    store = _open_worker_store(path, source_hash)
+    records = ((row, store.folded_text(row)) for row in range(start, end))
+    return match_records(records, mode, query, lambda: _search_generation.value != generation)
+
+
+def search_records(records, mode, query, generation):
+    """Search (row, lowercased text) records sent with the task (runs in a worker process)
+
+    Used when the descriptions are not in the store.
+    """
+    return match_records(records, mode, query, lambda: _search_generation.value != generation)
+
+
+class ShardedSearch:
+    """Runs regex and fuzzy searches on a pool of worker processes
+
+    A description store is partitioned into shards that each worker reads from
+    its own map of the file. Submitting a query bumps a generation counter in
+    shared memory; workers poll it and abandon shards belonging to an older
+    query. A worker that never gets back to polling (a regex stuck
+    backtracking) can only be stopped by terminating the pool.
+    """
+
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.context = multiprocessing.get_context()
+        self.generation = self.context.RawValue('q', 0)
+        self.pool = None
+        self.results = []
+        self.abandoned = []
+
+    def cancel(self):
+        """Abandon the running query, if any"""
+        self.generation.value += 1
+        self.abandoned = [result for result in self.abandoned + self.results if not result.ready()]
+        self.results = []
+
+    def stalled(self):
+        """Whether shards of an abandoned query are still running"""
+        self.abandoned = [result for result in self.abandoned if not result.ready()]
+        return bool(self.abandoned)
+
+    def _start(self):
+        self.cancel()
+        if self.pool is None:
+            self.pool = self.context.Pool(self.workers, initializer=_init_search_worker,
+                                          initargs=(self.generation,))
+        return self.generation.value
+
+    def submit(self, store, mode, query, shards=None):
+        """Start searching every record of store, by default in several shards per worker;
+        returns the pending results of the shards"""
+        generation = self._start()
+        count = len(store.ids)
+        shards = min(count, shards or self.workers * SEARCH_SHARDS_PER_WORKER) or 1
+        bounds = [count * i // shards for i in range(shards + 1)]
+        self.results = [
+            self.pool.apply_async(search_shard, (store.path, store.source_hash,
+                                                 bounds[i], bounds[i + 1], mode, query, generation))
+            for i in range(shards)
+        ]
+        return self.results
+
+    def submit_records(self, records, mode, query):
+        """Start searching a list of (row, lowercased text) records as one task"""
+        generation = self._start()
+        self.results = [self.pool.apply_async(search_records, (records, mode, query, generation))]
+        return self.results
+
+    @staticmethod
+    def merge(results):
+        """Combine finished shard results into store rows, best first; None if cancelled"""
+        partials = [result.get() for result in results]
+        if any(partial is None for partial in partials):
+            return None
+        return [row for _, row in heapq.merge(*partials)]
+
+    def terminate(self):
+        """Kill the workers at once, including any stuck in a query
+
+        A new pool is started by the next search.
+        """
+        self.generation.value += 1
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool = None
+        self.results = []
+        self.abandoned = []
+
 
 class YouTubeLikedSearcher:
     def __init__(self):
@@ -33,11 +1193,37 @@ class YouTubeLikedSearcher:
         self.API_VERSION = 'v3'
         self.CLIENT_SECRETS_FILE = 'client_secret.json'  # You need to download this
         self.credentials_file = 'token.json'
-        
-        self.youtube = None
+        self.cache_file = 'liked_videos_cache.json'
+        self.use_description_store = True  # Keep descriptions in a memory-mapped file
+
+        self.credentials = None
+        self.youtube = None  # Built from the credentials on the first API request
         self.liked_videos = []
         self.filtered_videos = []
-        
+
+        # Semantic search: embeddings live in a memory-mapped matrix next to the cache
+        cache_base = os.path.splitext(self.cache_file)[0]
+        self.description_store = DescriptionStore(cache_base + '_descriptions.bin')
+        self.history_file = cache_base + '_history.json'
+        self.snapshot_file = cache_base + '_index.snapshot'
+        self.prebuilt_rows = {}  # Table rows from the snapshot, used for the first display
+        self.sort_index = None   # Per-column ranks of liked_videos, built on first sort
+        self.sort_state = None   # (column, reverse) of the last sort, reapplied after a refresh
+        self.semantic_index = SemanticIndex(cache_base + '_embeddings.npy',
+                                            cache_base + '_embeddings.json',
+                                            cache_base + '_embeddings_model.npz')
+        self.semantic_index_loaded = False
+        self.embedding_pool = None
+        self.embedding_workers = max(1, (os.cpu_count() or 2) - 1)
+        self.embedding_job = None
+        self.embedding_pending = False
+
+        # Regex/fuzzy searches run in worker processes, sharded for large libraries
+        self.descriptions_in_store = False
+        self.sharded_search = None
+        self.search_job = None
+        self.search_after_id = None
+
         self.setup_ui()
         
     def setup_ui(self):
@@ -77,9 +1263,16 @@ class YouTubeLikedSearcher:
         self.search_entry = ttk.Entry(search_frame, textvariable=self.search_var, width=50)
         self.search_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(0, 5))
         self.search_entry.bind('<KeyRelease>', self.on_search_change)
-        
+
+        self.search_mode_var = tk.StringVar(value='Keyword')
+        self.search_mode = ttk.Combobox(search_frame, textvariable=self.search_mode_var,
+                                        values=('Keyword', 'Regex', 'Fuzzy', 'Semantic'),
+                                        state='readonly', width=10)
+        self.search_mode.grid(row=0, column=2, padx=(0, 5))
+        self.search_mode.bind('<<ComboboxSelected>>', self.on_search_mode_change)
+
         self.search_button = ttk.Button(search_frame, text="Search", command=self.search_videos)
-        self.search_button.grid(row=0, column=2)
+        self.search_button.grid(row=0, column=3)
         
         # Results info
         self.results_label = ttk.Label(main_frame, text="No videos loaded")
@@ -186,6 +1379,7 @@ class YouTubeLikedSearcher:
         
         file_menu.add_command(label="Load Videos from Cache", command=self.load_from_cache_menu)
         file_menu.add_command(label="Refresh Videos from YouTube", command=self.load_liked_videos)
+        file_menu.add_command(label="What Changed...", command=self.show_changes)
         file_menu.add_separator()
         file_menu.add_command(label="Export Current Results...", command=self.export_results)
         file_menu.add_command(label="Export All Videos...", command=self.export_all_videos)
@@ -227,8 +1421,8 @@ class YouTubeLikedSearcher:
         
         try:
             filename = f"youtube_all_liked_videos_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(self.liked_videos, f, indent=2, ensure_ascii=False)
+            with open(filename, 'wb') as f:
+                write_videos_json(f, (self.full_video(video) for video in self.liked_videos))
             
             messagebox.showinfo("Export Complete", f"All {len(self.liked_videos)} liked videos exported to {filename}")
         except Exception as e:
@@ -237,19 +1431,32 @@ class YouTubeLikedSearcher:
     def clear_cache(self):
         """Clear the local cache file"""
         try:
-            if os.path.exists('liked_videos_cache.json'):
+            if os.path.exists(self.cache_file):
                 result = messagebox.askyesno("Clear Cache", 
                     "Are you sure you want to clear the cache?\n\n"
                     "This will delete the locally stored video data. "
                     "You'll need to reload from YouTube next time.")
                 
                 if result:
-                    os.remove('liked_videos_cache.json')
+                    os.remove(self.cache_file)
+                    # Derived files are rebuilt from the cache, so they go with it
+                    self.restore_descriptions()
+                    self.semantic_index.close()
+                    self.semantic_index_loaded = False
+                    for path in self.derived_cache_files():
+                        if os.path.exists(path):
+                            os.remove(path)
                     messagebox.showinfo("Cache Cleared", "Cache file deleted successfully.")
             else:
                 messagebox.showinfo("No Cache", "No cache file found to clear.")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to clear cache: {str(e)}")
+
+    def derived_cache_files(self):
+        """Files stored next to the cache that are derived from its contents"""
+        return [self.semantic_index.matrix_file, self.semantic_index.index_file,
+                self.semantic_index.model_file,
+                self.description_store.path, self.snapshot_file]
     
     def show_shortcuts(self):
         """Show keyboard shortcuts dialog"""
@@ -309,9 +1516,12 @@ Getting Started:
 
 Features:
 • Real-time search through titles, channels, and descriptions
+• Regex and fuzzy (typo-tolerant) search modes
+• Semantic search mode also finds videos that use related words, learned from your library
 • Sort by any column (click headers)
 • Details pane shows full video information
 • Local caching for faster subsequent loads
+• Refreshes report added, removed and changed videos (File > What Changed)
 • Export search results or all videos
 
 Tips:
@@ -329,6 +1539,10 @@ Troubleshooting:
 
 Files Created:
 • liked_videos_cache.json - Local video cache
+• liked_videos_cache_descriptions.bin - Description store (memory-mapped)
+• liked_videos_cache_embeddings.* - Semantic search index
+• liked_videos_cache_history.json - Refresh changes and removed videos
+• liked_videos_cache_index.snapshot - Prebuilt index for fast startup
 • token.json - Authentication tokens
 • youtube_liked_search_results_*.json - Export files"""
         
@@ -428,6 +1642,10 @@ For support and updates, please refer to the setup documentation."""
     def on_closing(self):
         """Handle application closing"""
         # Could add save preferences or cleanup here if needed
+        self.stop_embedding_job()
+        # Search workers are killed rather than waited for, in case one is stuck in a query
+        self.stop_sharded_search()
+        self.description_store.close()
         self.root.destroy()
         
     def authenticate_and_load(self):
@@ -440,13 +1658,14 @@ For support and updates, please refer to the setup documentation."""
                 return
                 
             self.authenticate()
-            if self.youtube:
+            if self.credentials:
                 self.load_liked_videos()
         except Exception as e:
             messagebox.showerror("Authentication Error", str(e))
     
     def authenticate(self):
         """Authenticate with YouTube Data API"""
+        import_google_libraries()
         creds = None
         if os.path.exists(self.credentials_file):
             creds = Credentials.from_authorized_user_file(self.credentials_file, self.SCOPES)
@@ -462,12 +1681,20 @@ For support and updates, please refer to the setup documentation."""
             with open(self.credentials_file, 'w') as token:
                 token.write(creds.to_json())
         
-        self.youtube = build(self.API_SERVICE_NAME, self.API_VERSION, credentials=creds)
+        self.credentials = creds
+        self.youtube = None
         self.status_label.config(text="Authenticated successfully")
+
+    def youtube_service(self):
+        """Return the YouTube API client, building it (and loading its discovery document) on first use"""
+        if self.youtube is None:
+            import_google_libraries()
+            self.youtube = build(self.API_SERVICE_NAME, self.API_VERSION, credentials=self.credentials)
+        return self.youtube
     
     def load_liked_videos(self):
         """Load all liked videos from YouTube"""
-        if not self.youtube:
+        if not self.credentials and not self.youtube:
             messagebox.showerror("Error", "Please authenticate first")
             return
         
@@ -475,11 +1702,12 @@ For support and updates, please refer to the setup documentation."""
         self.root.update()
         
         try:
-            self.liked_videos = []
+            # Fetched pages are compared against the cached videos as they arrive
+            diff = LibraryDiff(self.liked_videos, self.video_hash)
             next_page_token = None
             
             while True:
-                request = self.youtube.videos().list(
+                request = self.youtube_service().videos().list(
                     part="snippet,statistics",
                     myRating="like",
                     maxResults=50,
@@ -487,6 +1715,7 @@ For support and updates, please refer to the setup documentation."""
                 )
                 response = request.execute()
                 
+                page = []
                 for video in response.get('items', []):
                     video_info = {
                         'id': video['id'],
@@ -496,105 +1725,677 @@ For support and updates, please refer to the setup documentation."""
                         'description': video['snippet'].get('description', ''),
                         'url': f"https://www.youtube.com/watch?v={video['id']}"
                     }
-                    self.liked_videos.append(video_info)
+                    page.append(video_info)
+                diff.add_page(page)
                 
                 next_page_token = response.get('nextPageToken')
                 if not next_page_token:
                     break
                     
-                self.status_label.config(text=f"Loading... {len(self.liked_videos)} videos loaded")
+                self.status_label.config(text=f"Loading... {len(diff.videos)} videos loaded")
                 self.root.update()
-            
+            diff.finish()
+
+            if diff.is_empty():
+                if self.liked_videos:
+                    self.record_changes(diff)
+                self.status_label.config(text=f"Loaded {len(self.liked_videos)} liked videos (no changes)")
+                return
+
+            # Removed videos must be recorded before the store holding their descriptions is rebuilt
+            if self.liked_videos:
+                self.record_changes(diff)
+
             # Sort by published date (most recent first)
-            self.liked_videos.sort(key=lambda x: x['published_at'], reverse=True)
-            
-            self.filtered_videos = self.liked_videos.copy()
-            self.update_results_display()
-            self.status_label.config(text=f"Loaded {len(self.liked_videos)} liked videos")
-            
-            # Save to local cache
+            diff.videos.sort(key=lambda x: x['published_at'], reverse=True)
+            # Rows and ranks of changed or removed videos must not be reused by the table and snapshot
+            stale_ids = {video['id'] for video in diff.removed} | {video['id'] for _, video in diff.changed}
+            for video_id in stale_ids:
+                self.prebuilt_rows.pop(video_id, None)
+            if self.sort_index is not None:
+                self.sort_index = update_sort_index(self.sort_index, diff.videos, self.tree_values, stale_ids)
+            self.liked_videos = diff.videos
+
+            # Save to local cache first so the table and any rerun query see the new store.
+            # Unchanged videos are copied, not serialized, and only changed records are
+            # appended to the store
             self.save_cache()
+            self.apply_library_changes(diff)
+            self.status_label.config(
+                text=f"Loaded {len(self.liked_videos)} liked videos "
+                     f"({len(diff.added)} added, {len(diff.removed)} removed, {len(diff.changed)} changed)")
+
+            # Only the changed videos are re-embedded
+            self.update_semantic_index()
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load videos: {str(e)}")
     
     def save_cache(self):
         """Save videos to local cache"""
+        # Written next to the cache and swapped in, so a failure never leaves a truncated cache
+        tmp_path = self.cache_file + '.tmp'
+        spans = []
         try:
-            with open('liked_videos_cache.json', 'w', encoding='utf-8') as f:
-                json.dump(self.liked_videos, f, indent=2, ensure_ascii=False)
+            with open(tmp_path, 'wb') as f:
+                cache_hash = self.write_cache_entries(f, spans)
+            os.replace(tmp_path, self.cache_file)
         except Exception as e:
             print(f"Failed to save cache: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self.sync_description_store(cache_hash, spans)
+        self.root.after_idle(self.save_snapshot)
+
+    def write_cache_entries(self, f, spans):
+        """Write liked_videos as the cache, copying the entries of videos whose description
+        is in the store from the current cache file instead of serializing them again"""
+        store = self.description_store
+        # The entry positions recorded in the store are only valid for the cache it was built from
+        if not (store.is_open() and os.path.exists(self.cache_file)
+                and file_sha1(self.cache_file) == store.source_hash):
+            return write_videos_json(f, (self.full_video(video) for video in self.liked_videos), spans)
+
+        with open(self.cache_file, 'rb') as old_file, \
+                mmap.mmap(old_file.fileno(), 0, access=mmap.ACCESS_READ) as old_cache:
+            def entry(video):
+                if video['description'] is None:
+                    span = store.cache_span(video['id'])
+                    if span is not None:
+                        return old_cache[span[0]:span[1]]
+                return self.full_video(video)
+            return write_videos_json(f, (entry(video) for video in self.liked_videos), spans)
     
     def load_cache(self):
         """Load videos from local cache"""
         try:
-            if os.path.exists('liked_videos_cache.json'):
-                with open('liked_videos_cache.json', 'r', encoding='utf-8') as f:
-                    self.liked_videos = json.load(f)
-                    self.filtered_videos = self.liked_videos.copy()
-                    self.update_results_display()
-                    self.status_label.config(text=f"Loaded {len(self.liked_videos)} videos from cache")
-                    return True
+            if os.path.exists(self.cache_file):
+                cache_hash = file_sha1(self.cache_file)
+                if not self.load_snapshot(cache_hash):
+                    with open(self.cache_file, 'rb') as f:
+                        data = f.read()
+                    # Pages can shift while paging through likes, so older caches may list a video twice
+                    self.liked_videos = list({video['id']: video for video in json.loads(data)}.values())
+                    self.sync_description_store(hashlib.sha1(data).hexdigest())
+                    del data
+                    self.sort_index = None
+                    # Written once the window is up so the next start can skip the work above
+                    self.root.after_idle(self.save_snapshot)
+
+                self.filtered_videos = self.liked_videos.copy()
+                self.update_results_display()
+                self.prebuilt_rows = {}
+                self.status_label.config(text=f"Loaded {len(self.liked_videos)} videos from cache")
+                self.update_semantic_index()
+                return True
         except Exception as e:
             print(f"Failed to load cache: {e}")
         return False
     
+    def load_snapshot(self, cache_hash):
+        """Restore videos, table rows and sort indexes from the snapshot if it matches the cache"""
+        if not self.use_description_store:
+            return False
+        payload = read_snapshot(self.snapshot_file, cache_hash)
+        if payload is None:
+            return False
+
+        # The snapshot's videos have no descriptions, so the store must match the same cache
+        store = self.description_store
+        self.cancel_search_job()
+        if store.source_hash != cache_hash and not (store.open() and store.source_hash == cache_hash):
+            return False
+
+        self.liked_videos = payload['videos']
+        self.descriptions_in_store = True
+        ids = [video['id'] for video in self.liked_videos]
+        self.prebuilt_rows = dict(zip(ids, payload['rows']))
+        self.sort_index = {column: array('I', payload['sort'][column]) for column in SORT_COLUMNS}
+        self.sort_index['positions'] = {video_id: i for i, video_id in enumerate(ids)}
+        return True
+
+    def save_snapshot(self):
+        """Save the loaded videos with their table rows and sort indexes for a fast next start"""
+        if not self.descriptions_in_store:
+            return
+        try:
+            rows = [self.tree_values(video) for video in self.liked_videos]
+            sort_index = self.get_sort_index(rows)
+            payload = {
+                'videos': self.liked_videos,
+                'rows': rows,
+                'sort': {column: sort_index[column].tobytes() for column in SORT_COLUMNS},
+            }
+            write_snapshot(self.snapshot_file, self.description_store.source_hash, payload)
+        except Exception as e:
+            print(f"Failed to save snapshot: {e}")
+
+    def get_sort_index(self, rows=None):
+        """Return per-column ranks of liked_videos, building them if the library changed"""
+        if self.sort_index is None:
+            if rows is None:
+                rows = [self.tree_values(video) for video in self.liked_videos]
+            self.sort_index = build_sort_index(rows)
+            self.sort_index['positions'] = {video['id']: i for i, video in enumerate(self.liked_videos)}
+        return self.sort_index
+
+    def sync_description_store(self, cache_hash, cache_spans=None):
+        """Move descriptions out of memory into the store built from the cache with this hash
+
+        cache_spans, the position of each video's entry, is given when the cache
+        was just written from liked_videos; the store is then updated in place.
+        """
+        if not self.use_description_store:
+            return
+        store = self.description_store
+        self.cancel_search_job()
+        try:
+            # Updating only appends to the store, so workers reading it can be left running
+            if store.source_hash != cache_hash and not (
+                    cache_spans is not None and store.update(self.liked_videos, cache_hash, cache_spans)):
+                self.stop_sharded_search()
+                self.stop_embedding_job()
+                if not (store.open() and store.source_hash == cache_hash):
+                    store.rebuild(self.liked_videos, self.get_description, cache_hash, cache_spans)
+        except Exception as e:
+            # The previous store is still mapped, so descriptions it holds stay readable
+            print(f"Failed to build description store: {e}")
+            self.descriptions_in_store = False
+            return
+
+        for video in self.liked_videos:
+            if video['id'] in store:
+                # Key is kept so exports preserve field order; the text is read on demand
+                video['description'] = None
+        self.descriptions_in_store = all(video['description'] is None for video in self.liked_videos)
+
+    def restore_descriptions(self):
+        """Bring descriptions back into memory before the store is closed or removed"""
+        self.stop_sharded_search()
+        self.stop_embedding_job()
+        for video in self.liked_videos:
+            video['description'] = self.get_description(video)
+        self.descriptions_in_store = False
+        self.description_store.close()
+
+    def get_description(self, video, max_chars=None):
+        """Return a video's full description (or its start), decoding it from the store if needed"""
+        description = video['description']
+        if description is None:
+            return self.description_store.get(video['id'], max_chars)
+        return description if max_chars is None else description[:max_chars]
+
+    def full_video(self, video):
+        """Return the video with its description filled in, for saving and exporting"""
+        if video['description'] is None:
+            return dict(video, description=self.get_description(video))
+        return video
+
+    def video_hash(self, video):
+        """Content hash of a loaded video, read from the store when its description lives there"""
+        if video['description'] is None:
+            return self.description_store.content_hash(video['id'])
+        return content_hash(video)
+
+    def load_history(self):
+        """Load the saved refresh changes and removed videos"""
+        try:
+            if os.path.exists(self.history_file):
+                with open(self.history_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"Failed to load history: {e}")
+        return {'last_refresh': None, 'removed': []}
+
+    def record_changes(self, diff):
+        """Save what a refresh changed and keep removed videos in the history
+
+        A refresh that found no changes only updates when the library was last
+        checked, so the last changes recorded are not mistaken for current ones.
+        """
+        history = self.load_history()
+        summary = diff.summary(self.get_description)
+        history['last_checked'] = summary['time']
+        if not diff.is_empty():
+            history['last_refresh'] = summary
+
+            # Videos that were liked again are no longer missing
+            added_ids = {video['id'] for video in diff.added}
+            history['removed'] = [video for video in history['removed'] if video['id'] not in added_ids]
+            history['removed'].extend(dict(self.full_video(video), removed_at=summary['time'])
+                                      for video in diff.removed)
+        try:
+            with open(self.history_file, 'w', encoding='utf-8') as f:
+                json.dump(history, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            print(f"Failed to save history: {e}")
+
+    def apply_library_changes(self, diff):
+        """Update the table in place after a refresh, keeping the selection and scroll position"""
+        if self.search_var.get().strip():
+            # Which videos match depends on the query, so run it again; regex and
+            # fuzzy results arrive later, so the view is restored when they do
+            self.search_videos(keep_view=True)
+        else:
+            selection = self.tree.selection()
+            scroll_position = self.tree.yview()[0]
+            self.filtered_videos = self.liked_videos.copy()
+            for video in diff.removed:
+                if self.tree.exists(video['id']):
+                    self.tree.delete(video['id'])
+            for _, video in diff.changed:
+                if self.tree.exists(video['id']):
+                    self.tree.item(video['id'], values=self.tree_values(video))
+            if diff.added:
+                positions = {video['id']: i for i, video in enumerate(self.filtered_videos)}
+                for video in sorted(diff.added, key=lambda v: positions[v['id']]):
+                    self.tree.insert('', positions[video['id']], iid=video['id'],
+                                     values=self.tree_values(video), tags=(video['id'],))
+            if self.sort_state and (diff.added or diff.changed):
+                # New rows were placed in date order and changed ones may sort differently now
+                self.sort_column(*self.sort_state)
+            self.update_results_label()
+            self.restore_view(selection, scroll_position)
+
+    def show_changes(self):
+        """Show what the last refresh changed and the history of removed videos"""
+        history = self.load_history()
+        lines = []
+        last = history.get('last_refresh')
+        last_checked = history.get('last_checked')
+        if last_checked and (not last or last_checked != last['time']):
+            lines.append(f"Last checked: {last_checked} — no changes since "
+                         f"{'the last refresh' if last else 'the videos were first loaded'}")
+            lines.append("")
+        if last:
+            lines.append(f"Last refresh: {last['time']}")
+            lines.append("")
+            lines.append(f"Added ({len(last['added'])}):")
+            lines.extend(f"  + {video['title']} — {video['channel']}" for video in last['added'])
+            lines.append("")
+            lines.append(f"Removed ({len(last['removed'])}):")
+            lines.extend(f"  - {video['title']} — {video['channel']}" for video in last['removed'])
+            lines.append("")
+            lines.append(f"Changed ({len(last['changed'])}):")
+            for video in last['changed']:
+                lines.append(f"  * {video['title']}")
+                for field, change in video['fields'].items():
+                    if field == 'description':
+                        lines.append("      description updated")
+                    else:
+                        lines.append(f"      {field}: {change[0]} → {change[1]}")
+        else:
+            lines.append("No changes recorded yet. Changes are tracked when videos are refreshed from YouTube.")
+
+        lines.append("")
+        lines.append(f"Removed videos history ({len(history['removed'])}):")
+        for video in reversed(history['removed']):
+            lines.append(f"  {video['removed_at'][:10]}  {video['title']} — {video['channel']}")
+            lines.append(f"              {video['url']}")
+
+        changes_window = tk.Toplevel(self.root)
+        changes_window.title("What Changed - YouTube Liked Videos Searcher")
+        changes_window.geometry("700x520")
+        changes_window.transient(self.root)
+
+        # Center the window
+        changes_window.geometry("+%d+%d" % (self.root.winfo_rootx() + 50, self.root.winfo_rooty() + 50))
+
+        text_frame = ttk.Frame(changes_window, padding="20")
+        text_frame.pack(fill=tk.BOTH, expand=True)
+
+        changes_text_widget = tk.Text(text_frame, wrap=tk.WORD, font=('TkDefaultFont', 10))
+        changes_scrollbar = ttk.Scrollbar(text_frame, orient=tk.VERTICAL, command=changes_text_widget.yview)
+        changes_text_widget.configure(yscrollcommand=changes_scrollbar.set)
+
+        changes_text_widget.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        changes_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        changes_text_widget.insert(1.0, "\n".join(lines))
+        changes_text_widget.config(state=tk.DISABLED)
+
+        # Close button
+        button_frame = ttk.Frame(changes_window, padding="20")
+        button_frame.pack(fill=tk.X)
+        ttk.Button(button_frame, text="Close", command=changes_window.destroy).pack(anchor=tk.E)
+
     def on_search_change(self, event):
         """Handle search input changes"""
-        # Add small delay to avoid too frequent searches
-        self.root.after(300, self.search_videos)
+        # Wait for typing to pause so each keystroke doesn't start its own search
+        if self.search_after_id is not None:
+            self.root.after_cancel(self.search_after_id)
+        self.search_after_id = self.root.after(SEARCH_DEBOUNCE_MS, self.search_videos)
     
-    def search_videos(self):
-        """Search through liked videos"""
+    def on_search_mode_change(self, event=None):
+        """Handle switching between keyword and semantic search"""
+        if self.search_mode_var.get() == 'Semantic':
+            if not import_numpy():
+                messagebox.showwarning("Semantic Search Unavailable",
+                    "Semantic search requires NumPy.\n\n"
+                    "Install it with: pip install numpy")
+                self.search_mode_var.set('Keyword')
+                return
+            self.update_semantic_index()
+        self.search_videos()
+
+    def update_semantic_index(self):
+        """Bring the embedding index up to date, embedding new or changed videos in the background"""
+        if self.search_mode_var.get() != 'Semantic' or not import_numpy():
+            return
+        if self.embedding_job:
+            # Rerun once the current job finishes so it picks up the latest videos
+            self.embedding_pending = True
+            return
+
+        if not self.semantic_index_loaded:
+            self.semantic_index.load()
+            self.semantic_index_loaded = True
+
+        if not self.liked_videos:
+            return
+        if self.embedding_pool is None:
+            self.embedding_pool = multiprocessing.get_context().Pool(self.embedding_workers)
+        store = self.description_store
+        videos = self.liked_videos
+
+        model = self.semantic_index.model
+        if model is None or (model.docs < LSA_FIT_MAX_DOCS and len(videos) >= model.docs * LSA_REFIT_GROWTH):
+            # Terms and their relations are learned from the library itself, so the
+            # model is refitted while the library is still growing into it
+            step = max(1, len(videos) // LSA_FIT_MAX_DOCS)
+            items = [self.embedding_item(video) for video in videos[::step][:LSA_FIT_MAX_DOCS]]
+            self.embedding_job = {'fit': self.embedding_pool.apply_async(
+                fit_semantic_model, (store.path, store.source_hash, items))}
+            self.status_label.config(text=f"Analyzing {len(items)} videos for semantic search...")
+            self.root.after(200, self.check_embedding_job)
+            return
+
+        ids = [video['id'] for video in videos]
+        hashes = [self.video_hash(video) for video in videos]
+        if self.semantic_index.is_current(ids, hashes):
+            return
+
+        missing = self.semantic_index.missing_rows(ids, hashes)
+        if not missing:
+            # Only removed videos, whose rows are dropped without embedding anything
+            try:
+                self.semantic_index.write(ids, hashes, {})
+            except Exception as e:
+                print(f"Failed to update semantic index: {e}")
+            return
+        self.embedding_job = {
+            'videos': videos, 'ids': ids, 'hashes': hashes, 'store_hash': store.source_hash,
+            'batches': deque(missing[start:start + EMBEDDING_BATCH_SIZE]
+                             for start in range(0, len(missing), EMBEDDING_BATCH_SIZE)),
+            'running': [], 'computed': {}, 'total': len(missing), 'error': None,
+        }
+        self.submit_embedding_batches(self.embedding_job)
+        self.status_label.config(text=f"Building semantic index for {len(missing)} videos...")
+        self.root.after(200, self.check_embedding_job)
+
+    def embedding_item(self, video):
+        """What an embedding worker needs for a video: its row in the description store,
+        or its text when the description is held in memory"""
+        if video['description'] is None:
+            return self.description_store.rows[video['id']]
+        return embedding_text(video['title'], video['channel'], video['description'][:EMBEDDING_MAX_CHARS])
+
+    def submit_embedding_batches(self, job):
+        """Keep a few batches per worker queued; texts are only gathered for batches being submitted"""
+        store = self.description_store
+        while job['batches'] and len(job['running']) < EMBEDDING_BATCHES_IN_FLIGHT * self.embedding_workers:
+            if store.source_hash != job['store_hash']:
+                # Rows would point into another store; what is left is embedded by the next update
+                break
+            rows = job['batches'].popleft()
+            items = [self.embedding_item(job['videos'][i]) for i in rows]
+            job['running'].append((rows, self.embedding_pool.apply_async(
+                embed_batch, (store.path, store.source_hash, self.semantic_index.model_file,
+                              self.semantic_index.model.model_id, items))))
+
+    def collect_embedding_batches(self, job):
+        """Move finished batches of a job into its computed rows"""
+        running = []
+        for rows, result in job['running']:
+            if not result.ready():
+                running.append((rows, result))
+                continue
+            try:
+                job['computed'].update(zip(rows, result.get()))
+            except Exception as e:
+                job['error'] = e
+        job['running'] = running
+
+    def check_embedding_job(self):
+        """Poll the background embedding job and store its results once complete"""
+        job = self.embedding_job
+        if not job:
+            return
+
+        if 'fit' in job:
+            if not job['fit'].ready():
+                self.root.after(200, self.check_embedding_job)
+                return
+            self.embedding_job = None
+            try:
+                self.semantic_index.set_model(job['fit'].get())
+            except Exception as e:
+                self.status_label.config(text="Failed to build semantic index")
+                print(f"Failed to fit semantic model: {e}")
+                self.rerun_pending_embedding()
+                return
+            # Every video is embedded with the new model
+            self.embedding_pending = False
+            self.update_semantic_index()
+            return
+
+        self.collect_embedding_batches(job)
+        if job['error'] is None:
+            self.submit_embedding_batches(job)
+        if job['running']:
+            self.status_label.config(
+                text=f"Building semantic index... {len(job['computed']) * 100 // job['total']}%")
+            self.root.after(200, self.check_embedding_job)
+            return
+
+        self.embedding_job = None
+        complete = len(job['computed']) == job['total']
+        if not self.write_embedding_job(job):
+            self.status_label.config(text="Failed to build semantic index")
+        elif complete:
+            self.status_label.config(text=f"Semantic index ready ({len(job['ids'])} videos)")
+
+        if self.embedding_pending:
+            self.rerun_pending_embedding()
+        elif complete and self.search_mode_var.get() == 'Semantic' and self.search_var.get().strip():
+            self.search_videos()
+
+    def write_embedding_job(self, job):
+        """Save the rows a job computed, returning False if a batch or the write failed"""
+        succeeded = job['error'] is None
+        if not succeeded:
+            print(f"Failed to embed videos: {job['error']}")
+        try:
+            if job['computed']:
+                self.semantic_index.write(job['ids'], job['hashes'], job['computed'])
+        except Exception as e:
+            print(f"Failed to build semantic index: {e}")
+            succeeded = False
+        return succeeded
+
+    def rerun_pending_embedding(self):
+        """Run the update requested while a job was busy, if any"""
+        if self.embedding_pending:
+            self.embedding_pending = False
+            self.update_semantic_index()
+
+    def stop_embedding_job(self):
+        """Terminate the embedding workers, saving the batches they already finished
+
+        Like the search workers they keep the description store mapped, which
+        Windows cannot replace or delete. A new pool is started by the next update.
+        """
+        job = self.embedding_job
+        self.embedding_job = None
+        if job and 'running' in job:
+            self.collect_embedding_batches(job)
+        if self.embedding_pool:
+            self.embedding_pool.terminate()
+            self.embedding_pool = None
+        if job and 'running' in job:
+            self.write_embedding_job(job)
+
+    def search_videos(self, keep_view=False):
+        """Search through liked videos
+
+        With keep_view the selection, scroll position and column sort are kept,
+        for when the library changed under an unchanged query.
+        """
+        if self.search_after_id is not None:
+            self.root.after_cancel(self.search_after_id)
+            self.search_after_id = None
+        self.cancel_search_job()
+        mode = self.search_mode_var.get()
         query = self.search_var.get().lower().strip()
         
         if not query:
             self.filtered_videos = self.liked_videos.copy()
+        elif mode in ('Regex', 'Fuzzy'):
+            if mode == 'Regex':
+                # Lowercasing would change escapes like \D or \S; matching ignores case anyway
+                query = self.search_var.get().strip()
+                try:
+                    re.compile(query)
+                except re.error as e:
+                    self.results_label.config(text=f"Invalid regular expression: {e}")
+                    return
+
+            self.start_search_job(mode, query, keep_view)
+            return
+        elif self.search_mode_var.get() == 'Semantic' and self.semantic_index.matrix is not None \
+                and not self.embedding_job:
+            # Rank by similarity in the latent space, where related terms share directions
+            videos_by_id = {video['id']: video for video in self.liked_videos}
+            self.filtered_videos = [videos_by_id[video_id]
+                                    for video_id, score in self.semantic_index.search(query)
+                                    if video_id in videos_by_id]
         else:
+            # Descriptions in the store are matched by scanning its mapped lowercase section
+            store_matches = self.description_store.search(query) if self.description_store.is_open() else set()
             self.filtered_videos = []
             for video in self.liked_videos:
+                if video['description'] is None:
+                    if video['id'] in store_matches:
+                        self.filtered_videos.append(video)
+                    continue
                 # Search in title, channel name, and description
                 searchable_text = f"{video['title']} {video['channel']} {video['description']}".lower()
                 if query in searchable_text:
                     self.filtered_videos.append(video)
         
-        self.update_results_display()
+        self.update_results_display(keep_view)
     
+    def start_search_job(self, mode, query, keep_view=False):
+        """Run a regex or fuzzy search in worker processes without blocking the UI
+
+        Large libraries are split into shards across every worker; smaller ones
+        are searched as a single shard.
+        """
+        self.search_job = {'mode': mode, 'query': query, 'keep_view': keep_view, 'results': None, 'waited': 0}
+        self.results_label.config(text=f"Searching {len(self.liked_videos)} videos...")
+        self.submit_search_job(self.search_job)
+
+    def submit_search_job(self, job):
+        """Hand a search to the workers once those still on cancelled queries have stopped"""
+        if job is not self.search_job:
+            return  # Superseded by a newer query
+        if self.sharded_search is None:
+            self.sharded_search = ShardedSearch()
+        search = self.sharded_search
+        if search.stalled():
+            if job['waited'] < SEARCH_TERMINATE_AFTER_MS:
+                job['waited'] += 50
+                self.root.after(50, self.submit_search_job, job)
+                return
+            # Still running long after being cancelled, e.g. a regex stuck backtracking
+            search.terminate()
+
+        mode, query = job['mode'], job['query']
+        if self.descriptions_in_store:
+            store = self.description_store
+            shards = None if len(store.ids) >= PARALLEL_SEARCH_MIN_VIDEOS[mode] else 1
+            job['results'] = search.submit(store, mode, query, shards)
+            job['ids'] = store.ids
+        else:
+            videos = list(self.liked_videos)
+            job['ids'] = [video['id'] for video in videos]
+            records = [(row, f"{video['title']} {video['channel']} {self.get_description(video)}".lower())
+                       for row, video in enumerate(videos)]
+            job['results'] = search.submit_records(records, mode, query)
+        self.root.after(50, self.check_search_job, job)
+
+    def check_search_job(self, job):
+        """Show the merged shard results once every shard has finished"""
+        if job is not self.search_job:
+            return  # Superseded by a newer query
+        if not all(result.ready() for result in job['results']):
+            self.root.after(50, self.check_search_job, job)
+            return
+
+        self.search_job = None
+        try:
+            rows = ShardedSearch.merge(job['results'])
+        except Exception as e:
+            self.results_label.config(text=f"Search failed: {e}")
+            return
+        if rows is None:
+            return
+
+        videos_by_id = {video['id']: video for video in self.liked_videos}
+        ids = job['ids']
+        self.filtered_videos = [videos_by_id[ids[row]] for row in rows if ids[row] in videos_by_id]
+        self.update_results_display(job['keep_view'])
+
+    def cancel_search_job(self):
+        """Stop any search still running for an earlier query"""
+        if self.search_job is not None:
+            self.search_job = None
+            if self.sharded_search:
+                self.sharded_search.cancel()
+                self.root.after(SEARCH_TERMINATE_AFTER_MS, self.reap_search_workers)
+
+    def reap_search_workers(self):
+        """Kill workers that ignored a cancel, unless a newer search is about to use them"""
+        if self.search_job is None and self.sharded_search and self.sharded_search.stalled():
+            self.sharded_search.terminate()
+
+    def stop_sharded_search(self):
+        """Terminate the search workers so none of them keeps the store file mapped
+
+        Windows cannot replace or delete a mapped file. Workers are killed
+        rather than waited for, so one stuck in a query cannot hang the UI. A
+        new pool is started by the next search.
+        """
+        self.search_job = None
+        if self.sharded_search:
+            self.sharded_search.terminate()
+            self.sharded_search = None
+
     def sort_column(self, col, reverse):
         """Sort treeview column"""
         try:
-            # Get data from treeview
-            data = []
-            for child in self.tree.get_children(''):
-                values = self.tree.item(child)['values']
-                tags = self.tree.item(child)['tags']
-                data.append((values, tags))
+            # Sort by the prebuilt per-column ranks instead of reading values back from the treeview
+            sort_index = self.get_sort_index()
+            positions = sort_index['positions']
+            ranks = sort_index[col]
+            children = list(self.tree.get_children(''))
+            children.sort(key=lambda child: ranks[positions[child]], reverse=reverse)
             
-            # Sort based on column
-            if col == 'date':
-                # Sort by date (convert to comparable format)
-                def date_key(item):
-                    try:
-                        # Assuming format YYYY-MM-DD
-                        date_str = item[0][2]  # Date is in column index 2
-                        return datetime.strptime(date_str, '%Y-%m-%d')
-                    except:
-                        return datetime.min
-                data.sort(key=date_key, reverse=reverse)
-            elif col == 'title':
-                data.sort(key=lambda item: item[0][0].lower(), reverse=reverse)
-            elif col == 'channel':
-                data.sort(key=lambda item: item[0][1].lower(), reverse=reverse)
-            elif col == 'description':
-                data.sort(key=lambda item: item[0][3].lower(), reverse=reverse)
-            
-            # Clear and repopulate treeview
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-            
-            for values, tags in data:
-                self.tree.insert('', tk.END, values=values, tags=tags)
+            # Reorder rows in place so item ids (and the selection) are kept
+            for index, child in enumerate(children):
+                self.tree.move(child, '', index)
+            self.sort_state = (col, reverse)
             
             # Update sort indicators in headers
             for column in ('title', 'channel', 'date', 'description'):
@@ -660,7 +2461,7 @@ For support and updates, please refer to the setup documentation."""
         # Update description
         self.detail_description.config(state=tk.NORMAL)
         self.detail_description.delete(1.0, tk.END)
-        description = video['description'] if video['description'] else "No description available."
+        description = self.get_description(video) or "No description available."
         self.detail_description.insert(1.0, description)
         self.detail_description.config(state=tk.DISABLED)  # Make read-only
     
@@ -682,43 +2483,56 @@ For support and updates, please refer to the setup documentation."""
         if hasattr(self, 'current_video_url') and self.current_video_url:
             webbrowser.open(self.current_video_url)
     
-    def update_results_display(self):
+    def update_results_display(self, keep_view=False):
         """Update the results treeview"""
+        if keep_view:
+            # Read when the results arrive, so changes made while searching count
+            selection = self.tree.selection()
+            scroll_position = self.tree.yview()[0]
+
         # Clear existing items
         for item in self.tree.get_children():
             self.tree.delete(item)
         
-        # Add filtered videos
+        # Add filtered videos; the video id doubles as the item id
         for video in self.filtered_videos:
-            # Format date
-            try:
-                date_obj = datetime.fromisoformat(video['published_at'].replace('Z', '+00:00'))
-                formatted_date = date_obj.strftime('%Y-%m-%d')
-            except:
-                formatted_date = video['published_at'][:10]
-            
-            # Truncate description for display
-            description = video['description'][:200] + ('...' if len(video['description']) > 200 else '')
-            # Remove newlines from description for better display
-            description = description.replace('\n', ' ').replace('\r', '')
-            
-            self.tree.insert('', tk.END, values=(
-                video['title'][:100] + ('...' if len(video['title']) > 100 else ''),
-                video['channel'],
-                formatted_date,
-                description
-            ), tags=(video['id'],))
-        
-        # Update results label
+            self.tree.insert('', tk.END, iid=video['id'], values=self.tree_values(video), tags=(video['id'],))
+        
+        self.update_results_label()
+
+        if keep_view:
+            if self.sort_state:
+                self.sort_column(*self.sort_state)
+            self.restore_view(selection, scroll_position)
+        else:
+            # Clear details when results change
+            self.clear_details()
+
+    def restore_view(self, selection, scroll_position):
+        """Scroll back and reselect the rows that are still in the table"""
+        selection = [item for item in selection if self.tree.exists(item)]
+        self.tree.yview_moveto(scroll_position)
+        if selection:
+            # Reselecting also refreshes the details pane in case the video changed
+            self.tree.selection_set(selection)
+        else:
+            self.clear_details()
+
+    def tree_values(self, video):
+        """Format a video as a row of the results treeview"""
+        values = self.prebuilt_rows.get(video['id'])
+        if values is None:
+            values = format_tree_row(video, self.get_description(video, 201))
+        return values
+
+    def update_results_label(self):
+        """Update the count of shown videos"""
         total = len(self.liked_videos)
         showing = len(self.filtered_videos)
         if total == showing:
             self.results_label.config(text=f"Showing all {total} videos")
         else:
             self.results_label.config(text=f"Showing {showing} of {total} videos")
-        
-        # Clear details when results change
-        self.clear_details()
     
     def open_video(self, event=None):
         """Open selected video in browser"""
@@ -741,8 +2555,8 @@ For support and updates, please refer to the setup documentation."""
         
         try:
             filename = f"youtube_liked_search_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(self.filtered_videos, f, indent=2, ensure_ascii=False)
+            with open(filename, 'wb') as f:
+                write_videos_json(f, (self.full_video(video) for video in self.filtered_videos))
             
             messagebox.showinfo("Export Complete", f"Results exported to {filename}")
         except Exception as e: